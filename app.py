@@ -2,17 +2,29 @@ import streamlit as st
 from code.extract_data import DataExtractor
 from code.visualise_data import WaitTimesVisualizer
 
+@st.cache_data(show_spinner=False)
+def load_wait_times(assets_path: str):
+    """Extract wait times data once per session instead of on every rerun."""
+    extractor = DataExtractor(assets_path)
+    return extractor.extract_wait_times()
+
+@st.cache_resource(show_spinner=False)
+def get_visualizer(assets_path: str) -> WaitTimesVisualizer:
+    """Build a single WaitTimesVisualizer instance reused across reruns."""
+    return WaitTimesVisualizer(load_wait_times(assets_path))
+
+@st.cache_data(show_spinner=False)
+def build_comparative_plots(assets_path: str, procedure: str):
+    """Memoize the Plotly figure per selected procedure."""
+    return get_visualizer(assets_path).create_comparative_plots(procedure)
+
 def main():
     st.title("Healthcare Wait Times Analysis")
-    
+
     try:
-        # Initialize data extractor
-        extractor = DataExtractor("assets")
-        wait_times_data = extractor.extract_wait_times()
-        
-        # Initialize visualizer
-        visualizer = WaitTimesVisualizer(wait_times_data)
-        
+        # Initialize visualizer (cached across reruns)
+        visualizer = get_visualizer("assets")
+
         # Create sidebar for procedure selection
         st.sidebar.header("Filters")
         selected_procedure = st.sidebar.selectbox(
@@ -23,7 +35,7 @@ def main():
         
         # Create and display the comparative plots
         st.header(f"Comparative Analysis - {selected_procedure.replace('_', ' ').title()}")
-        fig = visualizer.create_comparative_plots(selected_procedure)
+        fig = build_comparative_plots("assets", selected_procedure)
         st.plotly_chart(fig, use_container_width=True)
         
         # Add description
@@ -38,7 +50,9 @@ def main():
         Each line represents a different province/territory, allowing for easy comparison across regions.
         """)
         
-    except Exception as e:
+    except (FileNotFoundError, KeyError, ValueError) as e:
+        # Expected data problems (missing asset, missing column/sheet) get a
+        # friendly message; anything else should surface as a real traceback
         st.error(f"An error occurred: {str(e)}")
 
 if __name__ == "__main__":
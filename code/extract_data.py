@@ -1,23 +1,26 @@
 import pandas as pd
+import hashlib
 import os
-from typing import Dict, Optional, Union, Tuple
+from typing import Dict, Optional, Union
 import logging
-import sys
-# Set up logging
-# Create a memory handler that keeps only recent logs
-memory_handler = logging.handlers.MemoryHandler(
-    capacity=1000,  # Keep only last 1000 records
-    flushLevel=logging.ERROR,  # Automatically flush on ERROR
-    target=logging.StreamHandler(sys.stderr)  # Send to stderr for errors
-)
-# Configure logging to be minimal and memory-efficient
-logging.basicConfig(
-    level=logging.WARNING,  # Only log warnings and errors
-    format='%(levelname)s - %(message)s',  # Simplified format
-    handlers=[memory_handler]
-)
+
+# Logging configuration is left to the application entry point
 logger = logging.getLogger(__name__)
 
+# Prefer the Rust-based calamine reader (streams rows, 2-10x faster than
+# openpyxl); fall back to openpyxl in read-only mode when it is missing.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+    EXCEL_ENGINE_KWARGS = {}
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+    EXCEL_ENGINE_KWARGS = {'read_only': True, 'data_only': True}
+
+# Bumped whenever the shape of the extracted frames changes, so stale disk
+# caches from older code are not served
+CACHE_VERSION = 3
+
 class DataExtractor:
     def __init__(self, assets_path: str):
         """
@@ -27,28 +30,154 @@ class DataExtractor:
             assets_path (str): Path to the directory containing the XLSX files
         """
         self.assets_path = assets_path
+        self.cache_path = ".cache"
+        self._sheet_names: Dict[str, list] = {}
         self.wait_times_file = "wait-times-priority-procedures-in-canada-2024-data-tables-en.xlsx"
         self.hospital_spending_file = "hospital-spending-series-a-2005-2022-data-tables-en.xlsx"
+        # Resolve asset paths once instead of joining on every read
+        self._file_paths = {
+            filename: os.path.join(assets_path, filename)
+            for filename in (self.wait_times_file, self.hospital_spending_file)
+        }
+
+    def _file_path(self, filename: str) -> str:
+        """
+        Resolve a filename inside the assets directory, using the paths
+        precomputed in __init__ for the known data files.
+
+        Args:
+            filename (str): Name of the file inside the assets directory
+
+        Returns:
+            str: Full path to the file
+        """
+        path = self._file_paths.get(filename)
+        if path is None:
+            path = self._file_paths[filename] = os.path.join(self.assets_path, filename)
+        return path
+
+    def _cache_key(self, filename: str) -> str:
+        """
+        Compute a short content hash for a source file, used as the cache key.
+
+        Args:
+            filename (str): Name of the file inside the assets directory
+
+        Returns:
+            str: First 16 hex digits of the SHA-1 of the file contents
+        """
+        with open(self._file_path(filename), 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()[:16]
+
+    def _load_cached_frames(self, cache_file: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Load a previously cached extraction result, if one exists.
+
+        Args:
+            cache_file (str): Path to the cached pickle file
+
+        Returns:
+            Optional[Dict[str, pd.DataFrame]]: Cached DataFrames, or None on a cache miss
+        """
+        if os.path.exists(cache_file):
+            try:
+                frames = pd.read_pickle(cache_file)
+                logger.info("Loaded cached data from %s", cache_file)
+                return frames
+            except Exception as e:
+                logger.warning("Ignoring unreadable cache file %s: %s", cache_file, e)
+        return None
+
+    def _store_cached_frames(self, cache_file: str, frames: Dict[str, pd.DataFrame]) -> None:
+        """
+        Persist an extraction result to the cache directory.
+
+        Args:
+            cache_file (str): Path to write the pickle file to
+            frames (Dict[str, pd.DataFrame]): DataFrames to cache
+        """
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            pd.to_pickle(frames, cache_file)
+            logger.info("Cached extracted data to %s", cache_file)
+        except OSError as e:
+            logger.warning("Could not write cache file %s: %s", cache_file, e)
+
+    def _coerce_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop empty rows/columns and convert numeric-looking object columns in one pass.
+
+        Args:
+            df (pd.DataFrame): Raw DataFrame as read from an Excel sheet
+
+        Returns:
+            pd.DataFrame: Cleaned DataFrame with numeric columns converted
+        """
+        cleaned_df = df.dropna(how='all').dropna(how='all', axis=1)
+
+        obj_cols = cleaned_df.select_dtypes(include='object').columns
+        if len(obj_cols) > 0:
+            coerced = cleaned_df[obj_cols].apply(pd.to_numeric, errors='coerce')
+            # Only adopt columns where coercion kept every non-null value, so
+            # text columns and mixed year labels like '2021FY' stay untouched
+            numeric_cols = [col for col in obj_cols
+                            if coerced[col].notna().sum() == cleaned_df[col].notna().sum()]
+            cleaned_df[numeric_cols] = coerced[numeric_cols]
+
+        return cleaned_df
 
-    def read_excel_file(self, filename: str, sheet_name: Optional[Union[str,int]] = None, header: Optional[int] = 0, usecols: Optional[range] = None, skiprows: Optional[int] = 0, nrows: Optional[int] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    def _clean_wait_times_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean a wait times DataFrame for a single procedure.
+
+        Args:
+            df (pd.DataFrame): Raw wait times rows for one procedure
+
+        Returns:
+            pd.DataFrame: Cleaned DataFrame with Arrow-backed column dtypes
+        """
+        # Arrow-backed columns halve the memory of the string-heavy tables and
+        # serve st.cache_data/plotly without a numpy round-trip. Integer
+        # conversion is off so measurement columns stay floating point, and
+        # the mixed 'Data year' labels are left as-is.
+        return self._coerce_numeric_columns(df).convert_dtypes(
+            dtype_backend='pyarrow', convert_integer=False
+        )
+
+    def _get_sheet_names(self, file_path: str) -> list:
+        """
+        Return the sheet names of a workbook, reading them at most once per file.
+
+        Args:
+            file_path (str): Full path to the Excel file
+
+        Returns:
+            list: Sheet names in workbook order
+        """
+        if file_path not in self._sheet_names:
+            self._sheet_names[file_path] = pd.ExcelFile(file_path, engine=EXCEL_ENGINE).sheet_names
+        return self._sheet_names[file_path]
+
+    def read_excel_file(self, filename: str, sheet_name: Optional[Union[str,int]] = None, header: Optional[int] = 0, usecols: Optional[range] = None, skiprows: Optional[int] = 0, nrows: Optional[int] = None, dtype: Optional[Dict[str, str]] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """
             Read an Excel file and return the data from a specific sheet or all sheets.
             
             Args:
                 filename (str): Path to the Excel file.
-                sheet_name (str or int, optional): Name or index of the sheet to read. If not specified, all sheets are read.
+                sheet_name (str, int or list, optional): Name, index or list of indices of the sheet(s) to read. If not specified, all sheets are read.
                 header (int, optional): Row number to use as column names (default is 0, the first row).
                 usecols (range, optional): Specifies which columns to read from the file.
                 skiprows (int,optional): Number of rows to skip at the start (default is 0).
                 nrows (int, optional): Number of rows to read (default is None, which reads all rows).
+                dtype (dict, optional): Column name to dtype mapping applied while reading, avoiding post-hoc conversion.
             Returns:
                 Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
                 - If a specific sheet is requested, returns a single `DataFrame` for that sheet.
                 - If no `sheet_name` is provided, returns a dictionary where the keys are sheet names and the values are `DataFrame` objects for each sheet.
             """
         try:
-            file_path = os.path.join(self.assets_path, filename)
-            
+            file_path = self._file_path(filename)
+
             # Read with full options for proper data extraction
             if isinstance(sheet_name,str):
                 df = pd.read_excel(
@@ -56,34 +185,43 @@ class DataExtractor:
                     sheet_name=sheet_name,
                     header = header,
                     usecols= usecols,
-                    engine='openpyxl',
+                    engine=EXCEL_ENGINE,
+                    engine_kwargs=EXCEL_ENGINE_KWARGS,
+                    dtype=dtype,
                     na_values=['NA', 'N/A', ''],
                     keep_default_na=True
                 )
-                logger.info(f"Successfully read {filename}")
+                logger.info("Successfully read %s", filename)
                 return df
             else:
                 # Read all sheets if no sheet_name specified
-                name_of_sheet = pd.ExcelFile(file_path).sheet_names
+                name_of_sheet = self._get_sheet_names(file_path)
                 df = pd.read_excel(
                     file_path,
                     sheet_name=sheet_name,
                     header = header,
                     usecols= usecols,
-                    engine='openpyxl',
-                    skiprows=skiprows, 
+                    engine=EXCEL_ENGINE,
+                    engine_kwargs=EXCEL_ENGINE_KWARGS,
+                    dtype=dtype,
+                    skiprows=skiprows,
                     nrows=nrows,
                     na_values=['NA', 'N/A', ''],
                     keep_default_na=True
                 )
-                logger.info(f"Successfully read sheet {name_of_sheet[sheet_name]} from {filename}")
+                if isinstance(sheet_name, (list, tuple)):
+                    # pd.read_excel keys the result by the requested indices;
+                    # re-key by sheet name for callers
+                    logger.info("Successfully read %d sheets from %s", len(df), filename)
+                    return {name_of_sheet[i]: frame for i, frame in df.items()}
+                logger.info("Successfully read sheet %s from %s", name_of_sheet[sheet_name], filename)
                 return df, name_of_sheet[sheet_name]
             
         except FileNotFoundError:
-            logger.error(f"File not found: {filename}")
+            logger.error("File not found: %s", filename)
             raise
-        except Exception as e:
-            logger.error(f"Error reading {filename}: {str(e)}")
+        except (ValueError, IndexError) as e:
+            logger.error("Error reading %s: %s", filename, e)
             raise
 
     def extract_wait_times(self) -> Dict[str, pd.DataFrame]:
@@ -94,60 +232,30 @@ class DataExtractor:
             Dict[str, pd.DataFrame]: Dictionary containing DataFrames for different procedures
         """
         try:
-            wait_times_df = self.read_excel_file(self.wait_times_file, "Wait times 2008 to 2023", header = 2, usecols=range(8))
-            
-            # Extract specific procedures
+            cache_file = os.path.join(self.cache_path, f"{self._cache_key(self.wait_times_file)}_v{CACHE_VERSION}_wait_times.pkl")
+            cached = self._load_cached_frames(cache_file)
+            if cached is not None:
+                return cached
+
+            wait_times_df = self.read_excel_file(self.wait_times_file, "Wait times 2008 to 2023", header = 2, usecols=range(8),
+                                                 dtype={'Indicator result': 'float64'})
+
+            # Downstream analysis only consumes provincial rows, so drop the
+            # national and regional ones once here rather than on every
+            # visualization call
+            wait_times_df = wait_times_df[wait_times_df['Reporting level'] == 'Provincial']
+
+            # Split by indicator in one pass rather than scanning the full
+            # table once per procedure
+            indicator_groups = dict(iter(wait_times_df.groupby('Indicator', sort=False)))
             procedures = {
-                'hip_replacement': wait_times_df[wait_times_df['Indicator'] == 'Hip Replacement'],
-                'knee_replacement': wait_times_df[wait_times_df['Indicator'] == 'Knee Replacement']
+                'hip_replacement': self._clean_wait_times_data(indicator_groups['Hip Replacement']),
+                'knee_replacement': self._clean_wait_times_data(indicator_groups['Knee Replacement'])
             }
- 
-            return procedures
-            
-        except Exception as e:
-            logger.error(f"Error extracting wait times data: {str(e)}")
-            raise
 
-    def extract_hospital_spending(self) -> Dict[str, pd.DataFrame]:
-        """
-        Extract hospital spending data.
-        
-        Returns:
-            Dict[str, pd.DataFrame]: Dictionary with sheet names as keys and corresponding DataFrames as values.        """
-        try:
-            province_spending = {}
-            for i in range(2,14):
-                spending_df, name_sheet = self.read_excel_file(self.hospital_spending_file, sheet_name= i,header= 4, nrows= 18)
-                province_spending[name_sheet] = spending_df
-        
-            return province_spending
+            self._store_cached_frames(cache_file, procedures)
+            return procedures
             
-        except Exception as e:
-            logger.error(f"Error extracting hospital spending data: {str(e)}")
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            logger.error("Error extracting wait times data: %s", e)
             raise
-
-    def get_merged_data(self) -> pd.DataFrame:
-        """
-        Merge wait times and hospital spending data.
-        
-        Returns:
-            pd.DataFrame: Merged DataFrame containing both wait times and spending data
-        """
-        try:
-            wait_times = self.extract_wait_times()
-            spending = self.extract_hospital_spending()
-            
-            # Merge logic here - will need to be customized based on actual data structure
-            # This is a placeholder for the actual merge logic
-            merged_df = pd.merge(
-                wait_times['hip_replacement'],
-                spending,
-                on=['Province', 'Year'],
-                how='inner'
-            )
-            
-            return merged_df
-            
-        except Exception as e:
-            logger.error(f"Error merging data: {str(e)}")
-            raise
\ No newline at end of file
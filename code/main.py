@@ -1,6 +1,7 @@
 import logging
+import logging.handlers
 import time
-from extract_data import DataExtractor
+from spending_data import SpendingDataExtractor
 import sys
 
 # Create a memory handler that keeps only recent logs
@@ -20,33 +21,26 @@ logging.basicConfig(
 timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
 
 # Log the start of the run with timestamp
-logging.info(f"Run started at: {timestamp}")
+logging.info("Run started at: %s", timestamp)
 
 # Initialize the extractor
 try:
-    extractor = DataExtractor("/workspaces/universal/CIHI_Knee_Hip_wait/assets")
-    logging.info("DataExtractor initialized successfully.")
+    extractor = SpendingDataExtractor("/workspaces/universal/CIHI_Knee_Hip_wait/assets")
+    logging.info("SpendingDataExtractor initialized successfully.")
 except Exception as e:
-    logging.error(f"Error initializing DataExtractor: {e}")
+    logging.error("Error initializing SpendingDataExtractor: %s", e)
     raise
 
 # Try extracting wait times data and log any errors
 try:
     wait_times = extractor.extract_wait_times()
-    logging.info(f"Wait times data extracted successfully: {wait_times}")
+    logging.info("Wait times data extracted successfully: %s", wait_times)
 except Exception as e:
-    logging.error(f"Error extracting wait times: {e}")
+    logging.error("Error extracting wait times: %s", e)
 
 # Try extracting hospital spending data and log any errors
 try:
     spending = extractor.extract_hospital_spending()
-    logging.info(f"Hospital spending data extracted successfully: {spending}")
+    logging.info("Hospital spending data extracted successfully: %s", spending)
 except Exception as e:
-    logging.error(f"Error extracting hospital spending: {e}")
-
-# # Try getting merged data for analysis and log any errors
-# try:
-#     merged_data = extractor.get_merged_data()
-#     logging.info(f"Merged data extracted successfully: {merged_data}")
-# except Exception as e:
-#     logging.error(f"Error extracting merged data: {e}")
+    logging.error("Error extracting hospital spending: %s", e)
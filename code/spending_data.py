@@ -0,0 +1,57 @@
+import pandas as pd
+from typing import Dict
+import logging
+
+from extract_data import DataExtractor, CACHE_VERSION
+import os
+
+# Logging configuration is left to the application entry point
+logger = logging.getLogger(__name__)
+
+class SpendingDataExtractor(DataExtractor):
+    """
+    Extractor for the hospital spending workbook.
+
+    Lives in its own module so the Streamlit app, which only needs wait
+    times, never imports the spending code path.
+    """
+
+    def _clean_spending_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean a hospital spending DataFrame for a single province sheet.
+
+        Args:
+            df (pd.DataFrame): Raw spending rows for one province
+
+        Returns:
+            pd.DataFrame: Cleaned DataFrame
+        """
+        return self._coerce_numeric_columns(df)
+
+    def extract_hospital_spending(self) -> Dict[str, pd.DataFrame]:
+        """
+        Extract hospital spending data.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Dictionary with sheet names as keys and corresponding DataFrames as values.
+        """
+        try:
+            cache_file = os.path.join(self.cache_path, f"{self._cache_key(self.hospital_spending_file)}_v{CACHE_VERSION}_hospital_spending.pkl")
+            cached = self._load_cached_frames(cache_file)
+            if cached is not None:
+                return cached
+
+            # One batched read parses the workbook a single time and hands
+            # back all 12 per-province sheets
+            sheet_frames = self.read_excel_file(self.hospital_spending_file, sheet_name=list(range(2,14)), header= 4, nrows= 18)
+            province_spending = {
+                name_sheet: self._clean_spending_data(spending_df)
+                for name_sheet, spending_df in sheet_frames.items()
+            }
+
+            self._store_cached_frames(cache_file, province_spending)
+            return province_spending
+
+        except (FileNotFoundError, ValueError, IndexError) as e:
+            logger.error("Error extracting hospital spending data: %s", e)
+            raise
@@ -1,21 +1,11 @@
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from functools import lru_cache
 from typing import Dict, List
 import logging
-import sys
-# Create a memory handler that keeps only recent logs
-memory_handler = logging.handlers.MemoryHandler(
-    capacity=1000,  # Keep only last 1000 records
-    flushLevel=logging.ERROR,  # Automatically flush on ERROR
-    target=logging.StreamHandler(sys.stderr)  # Send to stderr for errors
-)
-# Configure logging to be minimal and memory-efficient
-logging.basicConfig(
-    level=logging.WARNING,  # Only log warnings and errors
-    format='%(levelname)s - %(message)s',  # Simplified format
-    handlers=[memory_handler]
-)
+
+# Logging configuration is left to the application entry point
 logger = logging.getLogger(__name__)
 
 class WaitTimesVisualizer:
@@ -29,7 +19,9 @@ class WaitTimesVisualizer:
         self.wait_times_data = wait_times_data
         self.procedures = list(wait_times_data.keys())
         self.metrics = ['% Meeting Benchmark', '50th Percentile', '90th Percentile', 'Volume']
-        
+        self._provincial_cache: Dict[str, pd.DataFrame] = {}
+        self._province_groups: Dict[str, Dict[str, pd.DataFrame]] = {}
+
     def prepare_provincial_data(self, procedure: str) -> pd.DataFrame:
         """
         Prepare data for provincial level visualization.
@@ -41,39 +33,75 @@ class WaitTimesVisualizer:
             pd.DataFrame: Processed data for provincial level analysis
         """
         try:
-            # Filter for provincial level data only
+            if procedure in self._provincial_cache:
+                return self._provincial_cache[procedure]
+
+            # Extraction already restricts the data to provincial rows, so
+            # just keep the columns the pivot needs; assign swaps in the
+            # categorical column on a shallow new frame instead of
+            # deep-copying the slice
             df = self.wait_times_data[procedure]
-            provincial_data = df[df['Reporting level'] == 'Provincial'].copy()
-            
-            # Pivot the data for easier plotting
-            pivoted_data = pd.pivot_table(
-                provincial_data,
-                values='Indicator result',
+            provincial_data = df[['Province/territory', 'Data year', 'Metric', 'Indicator result']]
+
+            # Categorical province codes make the pivot group on integer codes
+            # instead of repeated string comparisons
+            provincial_data = provincial_data.assign(
+                **{'Province/territory': provincial_data['Province/territory'].astype('category')}
+            )
+
+            # Pivot the data for easier plotting; province/year/metric rows
+            # are unique, so a plain pivot avoids pivot_table's groupby and
+            # aggregation machinery
+            pivoted_data = provincial_data.pivot(
                 index=['Province/territory', 'Data year'],
-                columns=['Metric'],
-                aggfunc='first'
-            ).reset_index()
-            
+                columns='Metric',
+                values='Indicator result'
+            ).sort_index().reset_index()
+
+            self._provincial_cache[procedure] = pivoted_data
             return pivoted_data
-            
-        except Exception as e:
-            logger.error(f"Error preparing provincial data: {str(e)}")
+
+        except (KeyError, ValueError) as e:
+            logger.error("Error preparing provincial data: %s", e)
             raise
 
+    def _get_province_groups(self, procedure: str) -> Dict[str, pd.DataFrame]:
+        """
+        Split the prepared provincial data into one DataFrame per province,
+        computed once per procedure and reused across widget interactions.
+
+        Args:
+            procedure (str): The medical procedure to analyze
+
+        Returns:
+            Dict[str, pd.DataFrame]: Mapping of province name to its rows
+        """
+        if procedure not in self._province_groups:
+            plot_data = self.prepare_provincial_data(procedure)
+            self._province_groups[procedure] = {
+                province: province_data
+                for province, province_data in plot_data.groupby('Province/territory', observed=True, sort=False)
+            }
+        return self._province_groups[procedure]
+
+    @lru_cache(maxsize=None)
     def create_comparative_plots(self, procedure: str) -> go.Figure:
         """
         Create comparative plots for different metrics of a procedure.
-        
+
+        Memoized per procedure: repeat calls return the already-built figure,
+        so callers should treat it as read-only.
+
         Args:
             procedure (str): The medical procedure to visualize
-            
+
         Returns:
             go.Figure: Plotly figure object containing the subplots
         """
         try:
-            # Prepare the data
-            plot_data = self.prepare_provincial_data(procedure)
-            
+            # Prepare the data, pre-split by province
+            province_groups = self._get_province_groups(procedure)
+
             # Create subplots - one for each metric
             fig = make_subplots(
                 rows=2, cols=2,
@@ -83,61 +111,38 @@ class WaitTimesVisualizer:
                     '90th Percentile Wait Time (Days)',
                     'Volume of Procedures'
                 ),
+                shared_xaxes=True,
                 vertical_spacing=0.15,
                 horizontal_spacing=0.1
             )
             
-            # Add traces for each province
-            for province in plot_data['Province/territory'].unique():
-                province_data = plot_data[plot_data['Province/territory'] == province]
-                
-                # % Meeting Benchmark
-                fig.add_trace(
-                    go.Scatter(
-                        x=province_data['Data year'],
-                        y=province_data['% Meeting Benchmark'],
-                        name=province,
-                        showlegend=True,
-                        mode='lines+markers'
-                    ),
-                    row=1, col=1
-                )
-                
-                # 50th Percentile
-                fig.add_trace(
-                    go.Scatter(
-                        x=province_data['Data year'],
-                        y=province_data['50th Percentile'],
-                        name=province,
-                        showlegend=False,
-                        mode='lines+markers'
-                    ),
-                    row=1, col=2
-                )
-                
-                # 90th Percentile
-                fig.add_trace(
-                    go.Scatter(
-                        x=province_data['Data year'],
-                        y=province_data['90th Percentile'],
-                        name=province,
-                        showlegend=False,
-                        mode='lines+markers'
-                    ),
-                    row=2, col=1
-                )
-                
-                # Volume
-                fig.add_trace(
-                    go.Scatter(
-                        x=province_data['Data year'],
-                        y=province_data['Volume'],
-                        name=province,
-                        showlegend=False,
-                        mode='lines+markers'
-                    ),
-                    row=2, col=2
-                )
+            # One subplot cell per metric; the legend is only shown for the
+            # first cell so each province appears once
+            metric_cells = [
+                ('% Meeting Benchmark', 1, 1, True),
+                ('50th Percentile', 1, 2, False),
+                ('90th Percentile', 2, 1, False),
+                ('Volume', 2, 2, False)
+            ]
+
+            # Build all traces from the precomputed per-province split instead
+            # of re-filtering the full table once per province
+            traces, rows, cols = [], [], []
+            for province, province_data in province_groups.items():
+                for metric, row, col, showlegend in metric_cells:
+                    traces.append(
+                        go.Scattergl(
+                            x=province_data['Data year'],
+                            y=province_data[metric],
+                            name=province,
+                            showlegend=showlegend,
+                            mode='lines+markers'
+                        )
+                    )
+                    rows.append(row)
+                    cols.append(col)
+
+            fig.add_traces(traces, rows=rows, cols=cols)
             
             # Update layout
             fig.update_layout(
@@ -159,8 +164,8 @@ class WaitTimesVisualizer:
             
             return fig
             
-        except Exception as e:
-            logger.error(f"Error creating comparative plots: {str(e)}")
+        except (KeyError, ValueError) as e:
+            logger.error("Error creating comparative plots: %s", e)
             raise
 
     def get_available_procedures(self) -> List[str]: